@@ -0,0 +1,8 @@
+"""
+Allow the package to be run as "python -m aruco <command>". See cli.py.
+"""
+# Project-Specific Imports
+from aruco.cli import main
+
+
+main()
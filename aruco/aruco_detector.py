@@ -5,10 +5,11 @@ This file be used in two ways:
 1. A library of functions
         Contain functions:
             annotate_tags(image, markerID, topLeft, topRight, btmRight, btmLeft)
+            detect_image(image, dict_type)
 
         -----
         Example Usage:
-            from aruco_detector import annotate_tags
+            from aruco.aruco_detector import annotate_tags
 
 2. Run as a script.
         Takes input image and annotate the image with bounding boxes, centres and marker IDs, if they are found.
@@ -19,6 +20,7 @@ This file be used in two ways:
         -----
         Example Usage:
             python aruco_detector.py --image example.png --type DICT_ARUCO_ORIGINAL
+            aruco detect --image example.png --type DICT_ARUCO_ORIGINAL
 """
 # Standard Imports
 import argparse
@@ -71,26 +73,24 @@ def annotate_tags(image: np.ndarray,
     return image
 
 
-# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
-if __name__ == '__main__':
+def detect_image(image: str = "example2.png", dict_type: str = "DICT_6X6_50"):
+    """
+    Detect ArUco markers in an image, print analytics and preview the annotated image.
 
-    # Get arguments
-    arg = argparse.ArgumentParser()
-    arg.add_argument("-i", "--image", type=str, default="example2.png", help="path to image containing ArUco marker")
-    arg.add_argument("-t", "--type", type=str, default="DICT_6X6_50", help="type of ArUco marker to generate")
-    args = vars(arg.parse_args())  # Convert argument to dictionary
+    :param image:     Path to the image, relative to this directory if not absolute.
+                      IMPORTANT: DO NOT GIVE AN IMAGE FULLY OCCUPIED BY THE MARKER ITSELF - IT CANNOT DETECT THE CORNERS
+    :param dict_type: Name of the ArUco dictionary, as in ARUCO_DICT
+    """
 
     # Find the image
-    # IMPORTANT: DO NOT GIVE AN IMAGE FULLY OCCUPIED BY THE MARKER ITSELF - IT CANNOT DETECT THE CORNERS
-    image_path = Path(Path(__file__).parent, args["image"]).resolve()
+    image_path = Path(Path(__file__).parent, image).resolve()
     image = cv2.imread(filename=str(image_path))
-    print(type(image))
 
     # Detect the image. Three items are returned:
     #   1) "corners" is a list containing x & y coordinates of detected ArUco markers
     #   2) "ids" is a list containing IDs of detected marker. None if no ID detected
     #   3) "rejected" is a list of potentially found but rejected markers. Useful for debugging.
-    arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT[args["type"]])  # Define what type of aruco markers to look for
+    arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT[dict_type])  # Define what type of aruco markers to look for
     arucoParams = cv2.aruco.DetectorParameters_create()  # Use default parameters
     (corners, ids, rejected) = cv2.aruco.detectMarkers(image=image,
                                                        dictionary=arucoDict,
@@ -121,3 +121,15 @@ if __name__ == '__main__':
         print("Previewing image, waiting for input to terminate ...")
         cv2.imshow("Image", image)
         cv2.waitKey(0)
+
+
+# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Get arguments
+    arg = argparse.ArgumentParser()
+    arg.add_argument("-i", "--image", type=str, default="example2.png", help="path to image containing ArUco marker")
+    arg.add_argument("-t", "--type", type=str, default="DICT_6X6_50", help="type of ArUco marker to detect")
+    args = vars(arg.parse_args())  # Convert argument to dictionary
+
+    detect_image(args["image"], args["type"])
@@ -2,6 +2,11 @@
 Created by: Gai Zhe
 
 This script generates the ArUco tags and store them as PNG files within directories of the same ArUco dictionary.
+
+-----
+Example Usage:
+    python aruco_generator.py --type DICT_6X6_50
+    aruco generate --type DICT_6X6_50
 """
 # Standard Imports
 import sys
@@ -16,39 +21,59 @@ import cv2
 from aruco.arucoDict import ARUCO_DICT
 
 
-# ARGUMENTS -----------------------------------------------------------------------------------------------------------
-arg = argparse.ArgumentParser()
-arg.add_argument("-t", "--type", type=str, default="DICT_6X6_50", help="type of ArUco marker to generate")
-args = vars(arg.parse_args())  # Convert argument to dictionary
+# FUNCTIONS ------------------------------------------------------------------------------------------------------------
+def generate_tags(dict_type: str = "DICT_6X6_50", output_dir=None) -> Path:
+    """
+    Save all possible IDs for the specified dictionary as PNG files within the same directory.
+
+    :param dict_type:  Name of the ArUco dictionary, as in ARUCO_DICT
+    :param output_dir: Directory in which a folder named after the dictionary is created. Defaults to "aruco_tags"
+                       beside this file
+
+    :return: The folder the tags are saved in
+    """
+
+    # CHECK IF DICTIONARY EXISTS ---------------------------------------------------------------------------------------
+    if ARUCO_DICT.get(dict_type, None) is None:
+        raise ValueError(f"ArUco tag type {dict_type} is not supported.")
+    arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT[dict_type])
 
+    # SAVE IMAGE -------------------------------------------------------------------------------------------------------
+    # Create a folder to store markers if not already
+    if output_dir is None:
+        output_dir = Path(Path(__file__).parent, "aruco_tags")
+    folder_path = Path(output_dir, dict_type).resolve()
+    folder_path.mkdir(parents=True, exist_ok=True)
 
-# CHECK IF DICTIONARY EXISTS -------------------------------------------------------------------------------------------
-if ARUCO_DICT.get(args["type"], None) is None:
-    print(f"ArUco tag type {args['type']} is not supported.")
-    sys.exit(0)
-arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT[args["type"]])
+    # Save each marker by looping over its ID
+    for marker_id in range(len(arucoDict.bytesList)):
 
+        # Save ArUco tag as an array called "tag". (P.S. ArUco is a binary image)
+        tag = np.zeros((300, 300, 1), dtype="uint8")
+        cv2.aruco.drawMarker(dictionary=arucoDict,
+                             id=marker_id,
+                             sidePixels=300,
+                             img=tag,
+                             borderBits=1)
 
-# SAVE IMAGE -----------------------------------------------------------------------------------------------------------
-# Save all possible IDs for the specified dictionary within the same directory
+        # Save the marker as a file within a folder corresponding to its dictionary
+        file_path = Path(folder_path, f"ID_{marker_id}").resolve()
+        cv2.imwrite(str(file_path) + ".png", img=tag)
 
-# Create a folder to store markers if not already
-folder_path = Path(Path(__file__).parent, "aruco_tags", args["type"]).resolve()
-folder_path.mkdir(parents=True, exist_ok=True)
+    print("All images saved.")
+    return folder_path
 
-# Save each marker by looping over its ID
-for marker_id in range(len(arucoDict.bytesList)):
 
-    # Save ArUco tag as an array called "tag". (P.S. ArUco is a binary image)
-    tag = np.zeros((300, 300, 1), dtype="uint8")
-    cv2.aruco.drawMarker(dictionary=arucoDict,
-                         id=marker_id,
-                         sidePixels=300,
-                         img=tag,
-                         borderBits=1)
+# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
 
-    # Save the marker as a file within a folder corresponding to its dictionary
-    file_path = Path(folder_path, f"ID_{marker_id}").resolve()
-    cv2.imwrite(str(file_path) + ".png", img=tag)
+    # Get arguments
+    arg = argparse.ArgumentParser()
+    arg.add_argument("-t", "--type", type=str, default="DICT_6X6_50", help="type of ArUco marker to generate")
+    args = vars(arg.parse_args())  # Convert argument to dictionary
 
-print("All images saved.")
+    try:
+        generate_tags(args["type"])
+    except ValueError as error:
+        print(error)
+        sys.exit(0)
@@ -0,0 +1,105 @@
+"""
+Created by: Gai Zhe
+
+Measure how long marker detection and pose estimation take on a still image.
+
+Detection is always timed. If a marker map is given, the per-marker pose (cv2.aruco.estimatePoseSingleMarkers) and the
+single marker map pose (see marker_map.py) are timed as well, on the same detections.
+
+-----
+Example Usage:
+    python benchmark.py --image example2.png --repeats 200
+    aruco bench --image example2.png --map board.json
+"""
+# Standard Imports
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict
+
+# Third-Party Imports
+import cv2
+
+# Project-Specific Imports
+from aruco.arucoDict import ARUCO_DICT
+from aruco.marker_map import MarkerMap
+from aruco.pose_estimation import MARKER_SIZE, load_calibration
+
+
+# FUNCTIONS ------------------------------------------------------------------------------------------------------------
+def time_function(func: Callable, repeats: int) -> float:
+    """
+    Measure the mean execution time of a function over several calls.
+
+    :param func:    The function to be called, without arguments
+    :param repeats: Number of calls
+
+    :return: The mean execution time [ms]
+    """
+    func()  # Warm up - the first call may include one-off allocations
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start_time) / repeats * 1000
+
+
+def run_benchmark(image: str = "example2.png",
+                  dict_type: str = "DICT_6X6_50",
+                  map_path=None,
+                  repeats: int = 100) -> Dict[str, float]:
+    """
+    Time detection, and optionally pose estimation, on a still image and print the results.
+
+    :param image:     Path to the image, relative to this directory if not absolute
+    :param dict_type: Name of the ArUco dictionary, as in ARUCO_DICT
+    :param map_path:  Optional path to a marker map file, to also time pose estimation
+    :param repeats:   Number of calls to average each measurement over
+
+    :return: A dictionary mapping each measurement to its mean execution time [ms]
+    """
+    image_path = Path(Path(__file__).parent, image).resolve()
+    gray_image = cv2.cvtColor(cv2.imread(str(image_path)), cv2.COLOR_BGR2GRAY)
+
+    arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT[dict_type])
+    arucoParams = cv2.aruco.DetectorParameters_create()  # Use default parameters
+
+    def detect():
+        return cv2.aruco.detectMarkers(image=gray_image, dictionary=arucoDict, parameters=arucoParams)
+
+    results = {"detection": time_function(detect, repeats)}
+    corners, ids, _ = detect()
+    n_markers = 0 if ids is None else len(ids)
+
+    if map_path is not None and n_markers > 0:
+        camMatrix, distCof = load_calibration()
+        marker_map = MarkerMap.from_file(map_path)
+
+        def single_marker_pose():
+            return cv2.aruco.estimatePoseSingleMarkers(corners=corners, markerLength=MARKER_SIZE,
+                                                       cameraMatrix=camMatrix, distCoeffs=distCof)
+
+        def marker_map_pose():
+            return marker_map.estimate_pose(corners, ids, camMatrix, distCof)
+
+        results["single-marker pose"] = time_function(single_marker_pose, repeats)
+        results["marker map pose"] = time_function(marker_map_pose, repeats)
+
+    print(f"Within the image of size {gray_image.shape}, {n_markers} tags are detected. Mean over {repeats} runs:")
+    for name, elapsed_time in results.items():
+        print(f"    {name}: {elapsed_time:.2f} ms")
+
+    return results
+
+
+# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Get arguments
+    arg = argparse.ArgumentParser()
+    arg.add_argument("-i", "--image", type=str, default="example2.png", help="path to image containing ArUco marker")
+    arg.add_argument("-t", "--type", type=str, default="DICT_6X6_50", help="type of ArUco marker to detect")
+    arg.add_argument("-m", "--map", type=str, default=None, help="path to a marker map file, to time pose estimation")
+    arg.add_argument("-n", "--repeats", type=int, default=100, help="number of runs to average over")
+    args = vars(arg.parse_args())  # Convert argument to dictionary
+
+    run_benchmark(args["image"], args["type"], args["map"], args["repeats"])
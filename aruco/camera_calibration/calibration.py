@@ -38,81 +38,93 @@ import numpy as np
 CHESS_BOARD_DIM = (9, 6)
 SQUARE_SIZE = 13.5          # Physical square size [mm]
 
-# Termination Criteria
-criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
-
 # DEFINE FILES/FOLDERS -------------------------------------------------------------------------------------------------
 current_dir = Path(__file__).parent
 
 # Path to checkerboard images for calibration
-image_dir = Path(current_dir, "checkerboard_images").resolve()
+IMAGE_DIR = Path(current_dir, "checkerboard_images").resolve()
+
+# Path to the calibration data
+OUTPUT_PATH = Path(current_dir, "MultiMatrix.npz")
+
+
+# FUNCTIONS ------------------------------------------------------------------------------------------------------------
+def calibrate(image_dir=IMAGE_DIR, output_path=OUTPUT_PATH):
+    """
+    Calibrate the camera from the checkerboard images and save the results as a "npz" file.
+
+    :param image_dir:   Directory containing the checkerboard images
+    :param output_path: Path of the "npz" file to be saved
 
+    :return: A tuple (camera matrix, distortion coefficients)
+    """
 
-# FIND OBJECT POINTS ---------------------------------------------------------------------------------------------------
-# Prepare a (9X3, 3) matrix. Each row represent a corner. Three columns represent their X, Y, Z coordinates
-obj_3D = np.zeros((CHESS_BOARD_DIM[0] * CHESS_BOARD_DIM[1], 3), dtype=np.float32)
-# Get the X and Y coordinates of each corner in terms of square size
-#   1. Create a mesh grid
-#   2. Transpose it
-#   3. Squeeze it into two columns. The (-1) is a placeholder to automatically infer the number of rows
-obj_3D[:, :2] = np.mgrid[0 : CHESS_BOARD_DIM[0], 0 : CHESS_BOARD_DIM[1]].T.reshape(-1, 2)
-# Multiple by square size to get actual size
-obj_3D *= SQUARE_SIZE
-print(obj_3D)
+    # Termination Criteria
+    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
 
-# Arrays to store object points and image points from all the images.
-obj_points_3D = []  # 3d point in real world space
-img_points_2D = []  # 2d points in image plane.
+    # FIND OBJECT POINTS -----------------------------------------------------------------------------------------------
+    # Prepare a (9X3, 3) matrix. Each row represent a corner. Three columns represent their X, Y, Z coordinates
+    obj_3D = np.zeros((CHESS_BOARD_DIM[0] * CHESS_BOARD_DIM[1], 3), dtype=np.float32)
+    # Get the X and Y coordinates of each corner in terms of square size
+    #   1. Create a mesh grid
+    #   2. Transpose it
+    #   3. Squeeze it into two columns. The (-1) is a placeholder to automatically infer the number of rows
+    obj_3D[:, :2] = np.mgrid[0 : CHESS_BOARD_DIM[0], 0 : CHESS_BOARD_DIM[1]].T.reshape(-1, 2)
+    # Multiple by square size to get actual size
+    obj_3D *= SQUARE_SIZE
 
+    # Arrays to store object points and image points from all the images.
+    obj_points_3D = []  # 3d point in real world space
+    img_points_2D = []  # 2d points in image plane.
 
-# FIND IMAGE POINTS ---------------------------------------------------------------------------------------------------
+    # FIND IMAGE POINTS ------------------------------------------------------------------------------------------------
+    # Find the set of image points for each image
+    for file in os.listdir(image_dir):
+        image_path = Path(image_dir, file)
+        print(f"Calibrating with image file '{file}'")
 
-# Find the set of image points for each image
-for file in os.listdir(image_dir):
-    image_path = Path(image_dir, file)
-    print(f"Calibrating with image file '{file}'")
+        image = cv2.imread(str(image_path))
+        grayScale = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        board_detected, corners = cv2.findChessboardCorners(image, CHESS_BOARD_DIM, None)
+        if board_detected:
+            # The object points are constant for all image taken
+            obj_points_3D.append(obj_3D)
 
-    image = cv2.imread(str(image_path))
-    grayScale = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    board_detected, corners = cv2.findChessboardCorners(image, CHESS_BOARD_DIM, None)
-    if board_detected:
-        # The object points are constant for all image taken
-        obj_points_3D.append(obj_3D)
+            # Refine the image points and append to img_points_2D
+            corners = cv2.cornerSubPix(grayScale, corners, (3, 3), (-1, -1), criteria)
+            img_points_2D.append(corners)
 
-        # Refine the image points and append to img_points_2D
-        corners = cv2.cornerSubPix(grayScale, corners, (3, 3), (-1, -1), criteria)
-        img_points_2D.append(corners)
+    # CALIBRATION ------------------------------------------------------------------------------------------------------
+    ret, mtx, dist, rvecs, tvecs = cv2.calibrateCamera(
+        obj_points_3D, img_points_2D, grayScale.shape[::-1], None, None
+    )
+    print("Calibrated")
 
-        img = cv2.drawChessboardCorners(image, CHESS_BOARD_DIM, corners, board_detected)
+    # SAVING DATA ------------------------------------------------------------------------------------------------------
+    print("Saving camera matrix, distortion coefficeints, radial and tangential vectors as a 'npz' file")
+    np.savez(
+        output_path,
+        camMatrix=mtx,
+        distCoef=dist,
+        rVector=rvecs,
+        tVector=tvecs,
+    )
 
+    return mtx, dist
 
-# CALIBRATION ----------------------------------------------------------------------------------------------------------
-ret, mtx, dist, rvecs, tvecs = cv2.calibrateCamera(
-    obj_points_3D, img_points_2D, grayScale.shape[::-1], None, None
-)
-print("Calibrated")
 
-# SAVING DATA ----------------------------------------------------------------------------------------------------------
-print("Saving camera matrix, distortion coefficeints, radial and tangential vectors as a 'npz' file")
-np.savez(
-    Path(current_dir, "MultiMatrix.npz"),
-    camMatrix=mtx,
-    distCoef=dist,
-    rVector=rvecs,
-    tVector=tvecs,
-)
+# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
 
-# LOADING DATA ---------------------------------------------------------------------------------------------------------
-print("-------------------------------------------")
-print("loading data stored using numpy savez function\n \n \n")
+    calibrate()
 
-data = np.load(Path(current_dir, 'MultiMatrix.npz'))
+    # LOADING DATA -----------------------------------------------------------------------------------------------------
+    print("-------------------------------------------")
+    print("loading data stored using numpy savez function\n \n \n")
 
-camMatrix = data["camMatrix"]
-distCof = data["distCoef"]
-rVector = data["rVector"]
-tVector = data["tVector"]
+    data = np.load(OUTPUT_PATH)
+    camMatrix = data["camMatrix"]
 
-print(camMatrix)
+    print(camMatrix)
 
-print("Loaded calibration data successfully")
+    print("Loaded calibration data successfully")
@@ -16,6 +16,10 @@ import imutils
 from imutils.video import VideoStream
 
 
+# DEFINITIONS ----------------------------------------------------------------------------------------------------------
+CHESS_BOARD_DIM = (9, 6)  # The chessboard has 9x6 image points (where black edges meet)
+
+
 # FUNCTIONS ------------------------------------------------------------------------------------------------------------
 def image_dir():
     # If it not yet exist, create a directory "checkerboard_images" to store images
@@ -29,11 +33,16 @@ def image_dir():
         
     return image_dir_path
 
-# MAIN SCRIPT ----------------------------------------------------------------------------------------------------------
-if __name__ == "__main__":
-    
+
+def capture_images():
+    """
+    Preview the camera feed and save snapshots in which a checkerboard is detected. Press "s" to save the current
+    frame and "q" to terminate.
+
+    :return: The number of saved images
+    """
+
     # Definitions
-    CHESS_BOARD_DIM = (9, 6)  # The chessboard has 9x6 image points (where black edges meet)
     criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
 
     # Prepare folder to store images
@@ -101,4 +110,10 @@ if __name__ == "__main__":
     cv2.destroyAllWindows()
     vs.stop()
 
-    print("Total saved Images:", n)
\ No newline at end of file
+    print("Total saved Images:", n)
+    return n
+
+
+# MAIN SCRIPT ----------------------------------------------------------------------------------------------------------
+if __name__ == "__main__":
+    capture_images()
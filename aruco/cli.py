@@ -0,0 +1,136 @@
+"""
+Created by: Gai Zhe
+
+Single command line entry point for the tools in this package, installed as the command "aruco".
+
+Each subcommand imports the module doing the actual work (and with it OpenCV, numpy and imutils) only when it runs, so
+that "aruco --help" and "aruco <subcommand> --help" start instantly.
+
+-----
+Example Usage:
+    aruco detect --image example.png --type DICT_ARUCO_ORIGINAL
+    aruco video
+    aruco pose --map board.json
+    aruco generate --type DICT_6X6_50
+    aruco calibrate
+    aruco capture
+    aruco bench --image example2.png --map board.json
+    python -m aruco <subcommand>
+"""
+# Standard Imports
+import argparse
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+
+# FUNCTIONS ------------------------------------------------------------------------------------------------------------
+def _user_path(path: str) -> str:
+    """
+    Resolve a path given on the command line against the current directory, if it exists there. Otherwise, leave it
+    to be resolved by the tool (e.g. the example images beside the package).
+    """
+    return str(Path(path).resolve()) if Path(path).exists() else path
+
+
+def _detect(args: argparse.Namespace):
+    from aruco.aruco_detector import detect_image
+    detect_image(_user_path(args.image), args.type)
+
+
+def _video(args: argparse.Namespace):
+    from aruco.aruco_detector_video import detect_video
+    detect_video(args.type)
+
+
+def _pose(args: argparse.Namespace):
+    from aruco.pose_estimation import estimate_pose_video
+    estimate_pose_video(args.map, seed=not args.no_seed, dict_type=args.type)
+
+
+def _generate(args: argparse.Namespace):
+    from aruco.aruco_generator import generate_tags
+    generate_tags(args.type, args.output)
+
+
+def _calibrate(args: argparse.Namespace):
+    from aruco.camera_calibration.calibration import calibrate, IMAGE_DIR, OUTPUT_PATH
+    calibrate(args.images or IMAGE_DIR, args.output or OUTPUT_PATH)
+
+
+def _capture(args: argparse.Namespace):
+    from aruco.camera_calibration.checkerboard_capturer import capture_images
+    capture_images()
+
+
+def _bench(args: argparse.Namespace):
+    from aruco.benchmark import run_benchmark
+    run_benchmark(_user_path(args.image), args.type, args.map, args.repeats)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the "aruco" command. Only the standard library is used here.
+
+    :return: The argument parser, with one subparser per tool
+    """
+    parser = argparse.ArgumentParser(prog="aruco", description="Computer vision tools based on ArUco markers.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show debug logging")
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    subparsers.required = True
+
+    # Arguments shared by several subcommands
+    dict_type = argparse.ArgumentParser(add_help=False)
+    dict_type.add_argument("-t", "--type", type=str, default="DICT_6X6_50", help="type of ArUco marker")
+    image = argparse.ArgumentParser(add_help=False)
+    image.add_argument("-i", "--image", type=str, default="example2.png", help="path to image containing ArUco marker")
+    marker_map = argparse.ArgumentParser(add_help=False)
+    marker_map.add_argument("-m", "--map", type=str, default=None, help="path to a marker map file")
+
+    detect = subparsers.add_parser("detect", parents=[image, dict_type], help="detect markers in an image")
+    detect.set_defaults(func=_detect)
+
+    video = subparsers.add_parser("video", parents=[dict_type], help="detect markers in the camera feed")
+    video.set_defaults(func=_video)
+
+    pose = subparsers.add_parser("pose", parents=[marker_map, dict_type], help="estimate marker pose in the camera feed")
+    pose.add_argument("--no-seed", action="store_true", help="do not seed the marker map pose with the previous frame")
+    pose.set_defaults(func=_pose)
+
+    generate = subparsers.add_parser("generate", parents=[dict_type], help="save every tag of a dictionary as PNG")
+    generate.add_argument("-o", "--output", type=str, default=None, help="directory to save the tags in")
+    generate.set_defaults(func=_generate)
+
+    calibrate = subparsers.add_parser("calibrate", help="calibrate the camera from checkerboard images")
+    calibrate.add_argument("--images", type=str, default=None, help="directory containing the checkerboard images")
+    calibrate.add_argument("-o", "--output", type=str, default=None, help="path of the calibration file to save")
+    calibrate.set_defaults(func=_calibrate)
+
+    capture = subparsers.add_parser("capture", help="capture checkerboard images for calibration")
+    capture.set_defaults(func=_capture)
+
+    bench = subparsers.add_parser("bench", parents=[image, dict_type, marker_map], help="time detection and pose")
+    bench.add_argument("-n", "--repeats", type=int, default=100, help="number of runs to average over")
+    bench.set_defaults(func=_bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Run the "aruco" command.
+
+    :param argv: Command line arguments, excluding the program name. Defaults to sys.argv[1:]
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+
+    try:
+        args.func(args)
+    except ValueError as error:
+        raise SystemExit(str(error))
+
+
+# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
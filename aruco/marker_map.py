@@ -0,0 +1,201 @@
+"""
+Created by: Gai Zhe
+
+Estimate a single camera pose per frame from a known layout of ArUco markers (a "marker map").
+
+Instead of solving the pose of every marker on its own (as cv2.aruco.estimatePoseSingleMarkers does), the corners of all
+visible markers are matched against their known 3D positions and passed to one robust PnP solve. More points give a
+better-conditioned problem, so the result is steadier and cheaper than N separate single-marker solves.
+
+Map files are JSON, in one of two forms. Positions are the marker centres in the map frame, in the same unit as
+marker_size. Markers are assumed to lie flat in the map's XY plane, axis-aligned, with Y pointing "up" the marker.
+    1) An explicit list of markers, keyed by ID. A centre may be given as [x, y] or [x, y, z]:
+        {"marker_size": 13.5, "markers": {"0": [0, 0], "1": [30, 0], "7": [0, 30, 0]}}
+    2) A regular grid (like cv2.aruco.GridBoard), IDs increasing row by row from the top-left marker:
+        {"marker_size": 13.5, "grid": {"rows": 4, "cols": 5, "separation": 3.0, "first_id": 0}}
+
+-----
+Example Usage:
+    from aruco.marker_map import MarkerMap
+
+    marker_map = MarkerMap.from_file("board.json")
+    pose = marker_map.estimate_pose(corners, ids, camMatrix, distCof)
+    if pose is not None:
+        rVec, tVec, n_inliers = pose
+"""
+# Standard Imports
+import json
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+# Third-Party Imports
+import numpy as np
+import cv2
+
+
+# FUNCTIONS ------------------------------------------------------------------------------------------------------------
+def marker_corners_3D(centre: Sequence[float], marker_size: float) -> np.ndarray:
+    """
+    Get the 3D coordinates of the four corners of a marker lying flat in the XY plane of the map.
+
+    :param centre:      The (X, Y) or (X, Y, Z) coordinates of the marker centre
+    :param marker_size: Side length of the marker
+
+    :return: A (4, 3) array of corners in the order top-left, top-right, bottom-right, bottom-left, i.e. the same order
+             returned by cv2.aruco.detectMarkers
+    """
+    c_x, c_y = centre[0], centre[1]
+    c_z = centre[2] if len(centre) > 2 else 0.0
+    half = marker_size / 2
+
+    return np.array([[c_x - half, c_y + half, c_z],
+                     [c_x + half, c_y + half, c_z],
+                     [c_x + half, c_y - half, c_z],
+                     [c_x - half, c_y - half, c_z]], dtype=np.float32)
+
+
+# CLASSES --------------------------------------------------------------------------------------------------------------
+class MarkerMap:
+    """
+    A known layout of ArUco markers, used to estimate one camera pose from all visible markers.
+
+    The 3D corners of every marker are precomputed once into a table indexed by marker ID, so matching the detections of
+    a frame to the map is a single array lookup.
+    """
+
+    # Parameters of the RANSAC PnP solve
+    REPROJECTION_ERROR = 3.0  # Maximum reprojection error [px] for a corner to count as an inlier
+    RANSAC_ITERATIONS = 100
+    MIN_INLIERS = 4           # At least one full marker must agree on the pose
+
+    def __init__(self, centres: Dict[int, Sequence[float]], marker_size: float):
+        """
+        :param centres:     A dictionary mapping each marker ID to the (X, Y) or (X, Y, Z) coordinates of its centre
+        :param marker_size: Side length of the markers, in the same unit as the centres
+        """
+        if not centres:
+            raise ValueError("A marker map needs at least one marker.")
+
+        self.marker_size = marker_size
+
+        # Table of 3D corners, indexed by marker ID. IDs not in the map are flagged in self.known
+        max_id = max(centres)
+        self.corner_table = np.zeros((max_id + 1, 4, 3), dtype=np.float32)
+        self.known = np.zeros(max_id + 1, dtype=bool)
+        for marker_id, centre in centres.items():
+            self.corner_table[marker_id] = marker_corners_3D(centre, marker_size)
+            self.known[marker_id] = True
+
+    @classmethod
+    def grid(cls, rows: int, cols: int, marker_size: float, separation: float, first_id: int = 0) -> "MarkerMap":
+        """
+        Create a map of markers laid out on a regular grid, with its origin at the bottom-left corner of the grid.
+
+        :param rows:        Number of markers along Y
+        :param cols:        Number of markers along X
+        :param marker_size: Side length of the markers
+        :param separation:  Gap between neighbouring markers
+        :param first_id:    ID of the top-left marker. IDs increase along each row, then down the rows
+
+        :return: The marker map
+        """
+        pitch = marker_size + separation
+        centres = {}
+        for row in range(rows):
+            for col in range(cols):
+                marker_id = first_id + row * cols + col
+                centres[marker_id] = (col * pitch + marker_size / 2, (rows - 1 - row) * pitch + marker_size / 2)
+
+        return cls(centres, marker_size)
+
+    @classmethod
+    def from_file(cls, path) -> "MarkerMap":
+        """
+        Load a marker map from a JSON file. See the module docstring for the file format.
+
+        :param path: Path to the JSON file
+
+        :return: The marker map
+        """
+        with open(Path(path), "r") as file:
+            layout = json.load(file)
+
+        marker_size = float(layout["marker_size"])
+        if "grid" in layout:
+            grid = layout["grid"]
+            return cls.grid(rows=int(grid["rows"]),
+                            cols=int(grid["cols"]),
+                            marker_size=marker_size,
+                            separation=float(grid.get("separation", 0.0)),
+                            first_id=int(grid.get("first_id", 0)))
+
+        centres = {int(marker_id): [float(v) for v in centre] for marker_id, centre in layout["markers"].items()}
+        return cls(centres, marker_size)
+
+    def match(self, corners: Sequence[np.ndarray], ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pair the detected corners with the 3D corners of the same markers in the map. Markers not in the map are ignored.
+
+        :param corners: The corners returned by cv2.aruco.detectMarkers
+        :param ids:     The IDs returned by cv2.aruco.detectMarkers
+
+        :return: A tuple (object points, image points) of shapes (N, 3) and (N, 2)
+        """
+        ids = np.asarray(ids).flatten()
+        in_map = ids < len(self.known)
+        in_map[in_map] = self.known[ids[in_map]]
+
+        obj_points_3D = self.corner_table[ids[in_map]].reshape(-1, 3)
+        img_points_2D = np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2)[in_map].reshape(-1, 2)
+
+        return obj_points_3D, img_points_2D
+
+    def estimate_pose(self,
+                      corners: Sequence[np.ndarray],
+                      ids: np.ndarray,
+                      camMatrix: np.ndarray,
+                      distCof: np.ndarray,
+                      prev_pose: Optional[Tuple[np.ndarray, np.ndarray]] = None):
+        """
+        Estimate the pose of the map relative to the camera with a single RANSAC PnP solve over all visible corners,
+        followed by a Levenberg-Marquardt refinement on the inliers.
+
+        :param corners:   The corners returned by cv2.aruco.detectMarkers
+        :param ids:       The IDs returned by cv2.aruco.detectMarkers
+        :param camMatrix: Camera matrix from calibration
+        :param distCof:   Distortion coefficients from calibration
+        :param prev_pose: Optional (rVec, tVec) of the previous frame, used as the initial guess of the solve
+
+        :return: A tuple (rVec, tVec, number of inlier corners), or None if no reliable pose is found
+        """
+        if ids is None or len(corners) == 0:
+            return None
+
+        obj_points_3D, img_points_2D = self.match(corners, ids)
+        if len(obj_points_3D) < self.MIN_INLIERS:
+            return None
+
+        if prev_pose is not None:
+            rVec, tVec = (np.array(v, dtype=np.float64).reshape(3, 1) for v in prev_pose)
+            use_guess = True
+        else:
+            rVec, tVec = np.zeros((3, 1)), np.zeros((3, 1))
+            use_guess = False
+
+        success, rVec, tVec, inliers = cv2.solvePnPRansac(objectPoints=obj_points_3D,
+                                                          imagePoints=img_points_2D,
+                                                          cameraMatrix=camMatrix,
+                                                          distCoeffs=distCof,
+                                                          rvec=rVec,
+                                                          tvec=tVec,
+                                                          useExtrinsicGuess=use_guess,
+                                                          iterationsCount=self.RANSAC_ITERATIONS,
+                                                          reprojectionError=self.REPROJECTION_ERROR)
+        if not success or inliers is None or len(inliers) < self.MIN_INLIERS:
+            return None
+
+        # Polish the pose using only the corners that agree with it
+        inliers = inliers.flatten()
+        rVec, tVec = cv2.solvePnPRefineLM(obj_points_3D[inliers], img_points_2D[inliers], camMatrix, distCof, rVec, tVec)
+
+        return rVec, tVec, len(inliers)
@@ -1,87 +1,159 @@
+"""
+Estimate the pose of ArUco markers in real-time using the calibrated camera.
+
+Takes two optional arguments:
+    --map (-m):   Path to a marker map file (see marker_map.py). If given, one camera pose is estimated per frame from
+                  all visible markers in the map. Otherwise, the pose of each marker is estimated independently
+    --no-seed:    In marker map mode, do not use the pose of the previous frame as the initial guess
+
+-----
+Example Usage:
+    python pose_estimation.py --map board.json
+    aruco pose --map board.json
+"""
 # Standard Imports
 import time
+import argparse
 from pathlib import Path
 
 # Third-Party Imports
 import cv2
 import numpy as np
-import imutils
 from imutils.video import VideoStream
 
 # Project-Specific Imports
 from aruco.arucoDict import ARUCO_DICT
+from aruco.marker_map import MarkerMap
 
 # DEFINITIONS ----------------------------------------------------------------------------------------------------------
-# Marker
 MARKER_SIZE = 13.5  # Square size [mm] - allow for pose and distance estimation
-arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT["DICT_6X6_50"])
-arucoParams = cv2.aruco.DetectorParameters_create()  # Use default parameters
+CALIBRATION_PATH = Path(Path(__file__).parent, "camera_calibration/MultiMatrix.npz").resolve()
 
-# LOAD CAMERA DATA -----------------------------------------------------------------------------------------------------
-current_dir = Path(__file__).parent
-data_path = Path(current_dir, "camera_calibration/MultiMatrix.npz").resolve()
-print(f"Loading calibration data stored in {data_path}...\n\n")
-
-data = np.load(data_path)
-camMatrix = data["camMatrix"]
-distCof = data["distCoef"]
-rVector = data["rVector"]
-tVector = data["tVector"]
-
-print("Loaded calibration data successfully")
 
 # FUNCTIONS ------------------------------------------------------------------------------------------------------------
+def load_calibration(data_path=CALIBRATION_PATH):
+    """
+    Load the camera matrix and distortion coefficients saved by camera_calibration/calibration.py.
+
+    :param data_path: Path to the "npz" file
+
+    :return: A tuple (camera matrix, distortion coefficients)
+    """
+    print(f"Loading calibration data stored in {data_path}...\n\n")
+
+    data = np.load(data_path)
+    camMatrix = data["camMatrix"]
+    distCof = data["distCoef"]
+
+    print("Loaded calibration data successfully")
+    return camMatrix, distCof
+
+
+def estimate_pose_video(map_path=None, seed: bool = True, dict_type: str = "DICT_6X6_50"):
+    """
+    Estimate and annotate the pose of ArUco markers in the camera feed until 'q' is pressed.
+
+    :param map_path:  Optional path to a marker map file. If given, one pose is estimated per frame from all visible
+                      markers in the map. Otherwise, the pose of each marker is estimated independently
+    :param seed:      In marker map mode, use the pose of the previous frame as the initial guess
+    :param dict_type: Name of the ArUco dictionary, as in ARUCO_DICT
+    """
+    arucoDict = cv2.aruco.Dictionary_get(ARUCO_DICT[dict_type])
+    arucoParams = cv2.aruco.DetectorParameters_create()  # Use default parameters
+
+    camMatrix, distCof = load_calibration()
+
+    # LOAD MARKER MAP --------------------------------------------------------------------------------------------------
+    marker_map = None
+    if map_path is not None:
+        marker_map = MarkerMap.from_file(map_path)
+        print(f"Loaded marker map with {int(marker_map.known.sum())} markers")
+    prev_pose = None  # Pose of the map in the previous frame, used to seed the next solve
+
+    vs = VideoStream().start()
+    time.sleep(2)  # Allow camera to warm up
+
+    while True:
+
+        frame = vs.read()
+
+        gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        (corners, ids, rejected) = cv2.aruco.detectMarkers(image=gray_frame,
+                                                           dictionary=arucoDict,
+                                                           parameters=arucoParams)
+
+        # If a marker map is given, estimate a single pose from all visible markers
+        if marker_map is not None:
+            pose = marker_map.estimate_pose(corners, ids, camMatrix, distCof, prev_pose=prev_pose)
+
+            if pose is not None:
+                rVec, tVec, n_inliers = pose
+                prev_pose = (rVec, tVec) if seed else None
+
+                cv2.polylines(
+                    frame, [c.astype(np.int32) for c in corners], isClosed=True, color=(0, 255, 255), thickness=4,
+                    lineType=cv2.LINE_AA
+                )
+
+                # Annotate Pose at the origin of the map
+                distance = np.linalg.norm(tVec)
+                cv2.drawFrameAxes(frame, camMatrix, distCof, rVec, tVec, length=marker_map.marker_size, thickness=4)
+                cv2.putText(frame, f"Dist: {distance:.1f} mm, inliers: {n_inliers}", (30, 40), cv2.FONT_HERSHEY_PLAIN,
+                            1.4, (0, 255, 0), 2, cv2.LINE_AA)
+            else:
+                prev_pose = None  # Lost track - do not seed the next solve with a stale pose
+
+        # Otherwise, if markers are detected, estimate the pose of each marker independently
+        elif corners:
+            rVec, tVec, _ = cv2.aruco.estimatePoseSingleMarkers(
+                corners=corners, markerLength=MARKER_SIZE, cameraMatrix=camMatrix, distCoeffs=distCof
+            )
 
-vs = VideoStream().start()
-time.sleep(2)  # Allow camera to warm up
+            total_markers = range(0, ids.size)
 
-while True:
-    
-    frame = vs.read()
-    
-    gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    (corners, ids, rejected) = cv2.aruco.detectMarkers(image=gray_frame,
-                                                       dictionary=arucoDict,
-                                                       parameters=arucoParams)
+            # ??? Polylines - draw for every marker on screen
 
-    # If checkerboard is detected
-    if corners:
-        rVec, tVec, _ = cv2.aruco.estimatePoseSingleMarkers(
-            corners=corners, markerLength=MARKER_SIZE, cameraMatrix=camMatrix, distCoeffs=distCof
-        )
+            for markerID, corner, i in zip(ids, corners, total_markers):
 
-        total_markers = range(0, ids.size)
+                topLeft, topRight, btmRight, btmLeft = corner.reshape((4, 2))
 
-        # ??? Polylines - draw for every marker on screen
+                # # Convert the coordinates to integers to be used by OpenCV (it is currently a 'numpy.float32')
+                # topLeft = (int(topLeft[0]), int(topLeft[1]))
+                # topRight = (int(topRight[0]), int(topRight[1]))
+                # btmRight = (int(btmRight[0]), int(btmRight[1]))
+                # btmLeft = (int(btmLeft[0]), int(btmLeft[1]))
 
-        for markerID, corner, i in zip(ids, corners, total_markers):
+                cv2.polylines(
+                    frame, [corner.astype(np.int32)], isClosed=True, color=(0, 255, 255), thickness=4,
+                    lineType=cv2.LINE_AA
+                )
 
-            topLeft, topRight, btmRight, btmLeft = corner.reshape((4, 2))
+                # Estimate distance from that particular marker
+                distance = np.sqrt(
+                    tVec[i][0][2] ** 2 + tVec[i][0][0] ** 2 + tVec[i][0][1] ** 2
+                )
 
-            # # Convert the coordinates to integers to be used by OpenCV (it is currently a 'numpy.float32')
-            # topLeft = (int(topLeft[0]), int(topLeft[1]))
-            # topRight = (int(topRight[0]), int(topRight[1]))
-            # btmRight = (int(btmRight[0]), int(btmRight[1]))
-            # btmLeft = (int(btmLeft[0]), int(btmLeft[1]))
+                # Annotate Pose
+                cv2.drawFrameAxes(frame, camMatrix, distCof, rVec[i], tVec[i], length=4, thickness=4)
 
-            cv2.polylines(
-                frame, [corner.astype(np.int32)], isClosed=True, color=(0, 255, 255), thickness=4, lineType=cv2.LINE_AA
-            )
+        cv2.imshow("Coloured Frame", frame)
 
-            # Estimate distance from that particular marker
-            distance = np.sqrt(
-                tVec[i][0][2] ** 2 + tVec[i][0][0] ** 2 + tVec[i][0][1] ** 2
-            )
+        # Terminate program and cleanup when 'q' is pressed
+        key = cv2.waitKey(1)
+        if key == ord('q'):
+            break
+
+    cv2.destroyAllWindows()
+    vs.stop()
 
-            # Annotate Pose
-            cv2.drawFrameAxes(frame, camMatrix, distCof, rVec[i], tVec[i], length=4, thickness=4)
 
-    cv2.imshow("Coloured Frame", frame)
+# WHEN RAN AS A SCRIPT -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
 
-    # Terminate program and cleanup when 'q' is pressed
-    key = cv2.waitKey(1)
-    if key == ord('q'):
-        break
+    # Get arguments
+    arg = argparse.ArgumentParser()
+    arg.add_argument("-m", "--map", type=str, default=None, help="path to a marker map file, to estimate one pose per frame")
+    arg.add_argument("--no-seed", action="store_true", help="do not seed the marker map pose with the previous frame")
+    args = vars(arg.parse_args())  # Convert argument to dictionary
 
-cv2.destroyAllWindows()
-vs.stop()
+    estimate_pose_video(args["map"], seed=not args["no_seed"])
@@ -8,8 +8,12 @@ To do this one of the commands below, depending on which environment you are in
 >>> pip install --editable .
 >>> conda develop .
 
+Installing with pip also provides the "aruco" command, e.g. "aruco detect --image example.png". See aruco/cli.py.
 """
 
 from setuptools import setup, find_packages
 
-setup(name='dronekitpy', version='1.0', packages=find_packages())
+setup(name='dronekitpy',
+      version='1.0',
+      packages=find_packages(),
+      entry_points={'console_scripts': ['aruco = aruco.cli:main']})
@@ -1,8 +1,8 @@
 import time
 import logging
 
-# Configure logger
-logging.basicConfig(level=logging.DEBUG)
+# Module logger. Configuring the output (e.g. logging.basicConfig) is left to the application
+logger = logging.getLogger(__name__)
 
 
 def measure_execution_time(func):
@@ -21,6 +21,6 @@ def measure_execution_time(func):
         start_time = time.time()                   # Start Timer
         result = func(*args, **kwargs)             # Run function
         elapsed_time = time.time() - start_time    # End Timer
-        logging.info(f"{func.__name__} took {elapsed_time * 1000:.2f} ms to execute")
+        logger.info(f"{func.__name__} took {elapsed_time * 1000:.2f} ms to execute")
         return result
     return wrapper